@@ -1,48 +1,438 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from playwright.sync_api import sync_playwright
-import json
+import orjson
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
 import base64
-from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
+from bs4 import BeautifulSoup, FeatureNotFound
+import soupsieve as sv
+try:
+    from lxml import etree as ET
+except ImportError:
+    # lxml not installed, fall back to the pure-Python parser
+    import xml.etree.ElementTree as ET
 from datetime import datetime
 import logging
+import os
+import threading
 import time
+import zlib
+from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used for request bodies and app.json"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Compress JSON responses above ~1KB (brotli or gzip, whichever the client accepts)
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json'],
+    COMPRESS_ALGORITHM=['br', 'gzip'],
+    COMPRESS_LEVEL=6,
+    COMPRESS_MIN_SIZE=1024,
+    # Compressing a streamed body would buffer it (or change its encodings); send it as is
+    COMPRESS_STREAMS=False
+)
+Compress(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of scraper threads; each keeps one Chromium alive for the life of the process
+MAX_WORKERS = int(os.environ.get('MAX_WORKERS', '4'))
+# Largest accepted batch, and how many of a batch's URLs may be on the scrape pool at
+# once (the rest are submitted as those finish)
+MAX_BATCH_URLS = int(os.environ.get('MAX_BATCH_URLS', '200'))
+BATCH_WINDOW = MAX_WORKERS
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--no-zygote',
+    '--disable-extensions',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    f'--user-agent={USER_AGENT}'
+]
+
+# Playwright's sync API is bound to the thread that started it, so every scrape
+# runs on this pool and each pool thread owns its own browser (see _get_browser)
+_SCRAPE_POOL = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='scraper')
+
+# robots.txt / sitemap fetches, two per in-flight scrape
+_FETCH_POOL = ThreadPoolExecutor(max_workers=2 * MAX_WORKERS, thread_name_prefix='fetch')
+
+# Common sitemap locations, in order of preference; all are probed at once
+SITEMAP_PATHS = ('/sitemap.xml', '/sitemap_index.xml', '/sitemap.txt',
+                 '/sitemaps.xml', '/wp-sitemap.xml', '/sitemap_index.php')
+# HEAD statuses that mean "try a GET" rather than "not there"
+SITEMAP_HEAD_UNSUPPORTED = frozenset({405, 501})
+_PROBE_POOL = ThreadPoolExecutor(max_workers=len(SITEMAP_PATHS) * MAX_WORKERS, thread_name_prefix='probe')
+
+# robots.txt / sitemap results per site origin, reused for FETCH_CACHE_TTL seconds
+# (FETCH_FAILURE_TTL when the host could not be reached); the oldest entries are
+# dropped beyond FETCH_CACHE_SIZE
+FETCH_CACHE_TTL = int(os.environ.get('FETCH_CACHE_TTL', '3600'))
+FETCH_FAILURE_TTL = int(os.environ.get('FETCH_FAILURE_TTL', '300'))
+FETCH_CACHE_SIZE = 512
+_fetch_cache = {}
+_fetch_cache_lock = threading.Lock()
+_browser_state = threading.local()
+
+# Keep-alive session for robots.txt and sitemap fetches, shared by all scrapes so
+# repeat visits to a host reuse its pooled connection (and TLS session). One quick
+# retry covers dropped connections and transient gateway errors
+_HTTP_SESSION = requests.Session()
+_HTTP_RETRY = Retry(total=1, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False)
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=(1 + len(SITEMAP_PATHS)) * MAX_WORKERS, max_retries=_HTTP_RETRY)
+_HTTP_SESSION.mount('http://', _HTTP_ADAPTER)
+_HTTP_SESSION.mount('https://', _HTTP_ADAPTER)
+_HTTP_SESSION.headers['User-Agent'] = USER_AGENT
+# (connect, read) timeouts for those fetches, and the errors that mean the host is unreachable
+FETCH_TIMEOUT = (3, 10)
+_UNREACHABLE_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+# Upper bound on each render/lazy-load wait, and the scroll stops used to trigger lazy loading
+SETTLE_TIMEOUT_MS = 5000
+# Largest extra settle time a client may request with wait_ms; larger values are capped
+MAX_WAIT_MS = 10000
+SCROLL_POSITIONS = (0.25, 0.5, 0.75, 1)
+_SCROLL_STEP_JS = """([p, ms]) => new Promise(resolve => {
+    window.scrollTo(0, document.body.scrollHeight * p);
+    setTimeout(resolve, ms);
+    requestAnimationFrame(() => requestAnimationFrame(resolve));
+})"""
+# The network counts as settled once no request has been in flight for this long,
+# polled every NETWORK_POLL_MS (short page waits let Playwright deliver request events)
+NETWORK_QUIET_MS = 500
+NETWORK_POLL_MS = 50
+
+# Request types the extractors never look at; aborted before they hit the network
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# URL prefixes shared by the link/script/stylesheet classifiers
+_EXTERNAL_URL_PREFIXES = ('http://', 'https://', '//')
+_HTTP_SCHEMES = ('http://', 'https://')
+_MAILTO_PREFIX = 'mailto:'
+_TEL_PREFIX = 'tel:'
+
+# (domain, platform) pairs matched as substrings of a link's host, first hit wins
+_SOCIAL_DOMAINS = tuple((domain, domain.replace('.com', '')) for domain in (
+    'facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com',
+    'youtube.com', 'tiktok.com', 'pinterest.com', 'snapchat.com',
+    'whatsapp.com', 'telegram.org'))
+# The contact section only reports the mainstream networks
+_CONTACT_SOCIAL_DOMAINS = _SOCIAL_DOMAINS[:7]
+_DOWNLOAD_EXTENSIONS = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+                        '.zip', '.rar', '.mp3', '.mp4', '.avi', '.mov', '.jpg', '.png')
+
+# XML sitemap tags, matched by local name so sitemaps with another (or no) namespace
+# still parse; entries beyond MAX_SITEMAP_URLS are not parsed
+MAX_SITEMAP_URLS = 500
+SITEMAP_URL_TAG = 'url'
+SITEMAP_INDEX_TAG = 'sitemap'
+SITEMAP_LOC_TAG = 'loc'
+SITEMAP_IMAGE_TAG = 'image'
+SITEMAP_VIDEO_TAG = 'video'
+SITEMAP_FIELD_TAGS = {
+    SITEMAP_URL_TAG: ('lastmod', 'changefreq', 'priority'),
+    SITEMAP_INDEX_TAG: ('lastmod',)
+}
+# Sitemaps served as raw .gz bodies (rather than with Content-Encoding) start with this
+GZIP_MAGIC = b'\x1f\x8b'
+# lxml parser options: only report the tags read below, and never expand entities or
+# fetch external resources from a sitemap
+_SITEMAP_LXML = hasattr(ET, 'LXML_VERSION')
+SITEMAP_PARSER_OPTIONS = {
+    'tag': tuple('{*}' + tag for tag in (SITEMAP_URL_TAG, SITEMAP_INDEX_TAG, SITEMAP_IMAGE_TAG, SITEMAP_VIDEO_TAG)),
+    'resolve_entities': False,
+    'no_network': True
+} if _SITEMAP_LXML else {}
+
+# Multi-tag buckets filled by WebScraper._walk_once, keyed like the find_all() name lists they replace
+_TAG_GROUPS = {
+    'h1': 'h1,h2,h3,h4,h5,h6',
+    'h2': 'h1,h2,h3,h4,h5,h6',
+    'h3': 'h1,h2,h3,h4,h5,h6',
+    'h4': 'h1,h2,h3,h4,h5,h6',
+    'h5': 'h1,h2,h3,h4,h5,h6',
+    'h6': 'h1,h2,h3,h4,h5,h6',
+    'ul': 'ul,ol',
+    'ol': 'ul,ol',
+    'img': 'img,script,link,iframe,audio,video',
+    'script': 'img,script,link,iframe,audio,video',
+    'link': 'img,script,link,iframe,audio,video',
+    'iframe': 'img,script,link,iframe,audio,video',
+    'audio': 'img,script,link,iframe,audio,video',
+    'video': 'img,script,link,iframe,audio,video'
+}
+
+# Attribute buckets filled by WebScraper._walk_once for queries that can match any tag
+_ATTR_BUCKETS = {attr: f'[{attr}]' for attr in ('itemscope', 'typeof', 'aria-label', 'role')}
+
+# Content-area selectors, in preference order. Bare tag names are answered from the
+# tag buckets; the rest are compiled once here instead of on every select_one() call
+MAIN_CONTENT_SELECTORS = ('main', 'article', '.content', '.main', '#content', '#main')
+SIDEBAR_SELECTORS = ('aside', '.sidebar', '.side', '#sidebar')
+NAV_SELECTORS = ('nav', '.navigation', '.nav', '#navigation', '#nav')
+FOOTER_SELECTORS = ('footer', '.footer', '#footer')
+_COMPILED_SELECTORS = {
+    selector: sv.compile(selector)
+    for selector in MAIN_CONTENT_SELECTORS + SIDEBAR_SELECTORS + NAV_SELECTORS + FOOTER_SELECTORS
+    if not selector.isalnum()
+}
+_NAV_LINKS_SELECTOR = sv.compile('nav a, .nav a, .navigation a')
+
+# Entries reported by WebScraper._check_mixed_content
+MAX_MIXED_CONTENT = 10
+
+def _json_response(obj):
+    """jsonify() replacement that encodes with orjson"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype='application/json')
+
+# (epoch second, ISO string) of the last _timestamp() call
+_timestamp_cache = (0, '')
+
+def _timestamp():
+    """Local ISO timestamp at second resolution, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    second, text = _timestamp_cache
+    if now != second:
+        text = datetime.fromtimestamp(now).isoformat()
+        _timestamp_cache = (now, text)
+    return text
+
+def _normalize_url(url):
+    """Default scheme-less URLs to https"""
+    return url if url.startswith(_HTTP_SCHEMES) else 'https://' + url
+
+def _track_requests(page):
+    """Record the page's in-flight requests and the time of the last request event"""
+    state = {'inflight': set(), 'last_event': time.monotonic()}
+    
+    def started(request):
+        state['inflight'].add(request)
+        state['last_event'] = time.monotonic()
+    
+    def ended(request):
+        state['inflight'].discard(request)
+        state['last_event'] = time.monotonic()
+    
+    page.on('request', started)
+    page.on('requestfinished', ended)
+    page.on('requestfailed', ended)
+    return state
+
+def _wait_for_network_quiet(page, state, timeout_ms):
+    """Wait until no request has been in flight for NETWORK_QUIET_MS, or timeout_ms passes"""
+    deadline = time.monotonic() + timeout_ms / 1000
+    quiet = NETWORK_QUIET_MS / 1000
+    while time.monotonic() < deadline:
+        if not state['inflight'] and time.monotonic() - state['last_event'] >= quiet:
+            return True
+        page.wait_for_timeout(NETWORK_POLL_MS)
+    return False
+
+def _parse_wait_ms(value):
+    """Validate a request's wait_ms: a non-negative integer, capped at MAX_WAIT_MS"""
+    error = ValueError('wait_ms must be a non-negative integer')
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise error
+    try:
+        wait_ms = int(value)
+    except ValueError:
+        raise error
+    if wait_ms < 0:
+        raise error
+    return min(wait_ms, MAX_WAIT_MS)
+
+def _rel_matches(tag, values):
+    """Match a tag's rel attribute the way find_all(rel=...) does"""
+    rel = tag.get('rel')
+    if not rel:
+        return False
+    if isinstance(rel, str):
+        return rel in values
+    return any(value in values for value in rel) or ' '.join(rel) in values
+
+_WORD_RE = re.compile(r'\S+')
+_WS_RE = re.compile(r'\s+')
+
+# Patterns used by WebScraper._extract_business_info. Phone and hours patterns are paired
+# with a literal every match must contain, so the regex is skipped when the text lacks it
+_ADDRESS_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\d+\s+[A-Za-z\s]+(?:street|str|avenue|ave|road|rd|drive|dr|lane|ln|boulevard|blvd).*?\d{4,5}',
+    r'\d{4,5}\s+[A-Z]{2}\s+[A-Za-z\s]+',  # Dutch postal codes
+    r'[A-Za-z\s]+\s+\d+[A-Za-z]?\s*,\s*\d{4,5}\s+[A-Za-z\s]+',
+))
+_PHONE_PATTERNS = tuple((literal, re.compile(p)) for literal, p in (
+    ('+31', r'(\+31\s?(?:\(0\)\s?)?[1-9](?:\s?\d){8})'),  # Dutch format
+    ('+', r'(\+\d{1,3}\s?\d{1,14})'),  # International
+    ('0', r'(\b0\d{1,3}[-\s]?\d{6,7}\b)'),  # Local Dutch
+    ('', r'(\b\d{3,4}[-\s]?\d{6,7}\b)')  # Local format
+))
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_HOURS_PATTERNS = tuple((literal, re.compile(p, re.IGNORECASE)) for literal, p in (
+    ('', r'(?:open|hours?|tijd|tijden).*?(?:\d{1,2}:\d{2}|\d{1,2}\s*(?:am|pm))'),
+    (':', r'(?:maandag|monday|ma).*?(?:vrijdag|friday|vr).*?\d{1,2}:\d{2}'),
+    (':', r'\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}')
+))
+
+def _count_words(text):
+    """Count whitespace-separated words without building the list split() would"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+def _bounded_text(elem, limit):
+    """elem.text.strip()[:limit], without joining the text past the first limit characters"""
+    parts = []
+    length = 0
+    # End of the last non-whitespace character seen, i.e. the length of the rstripped text so far
+    text_end = 0
+    for string in elem.strings:
+        if not parts:
+            string = string.lstrip()
+            if not string:
+                continue
+        parts.append(string)
+        stripped = string.rstrip()
+        if stripped:
+            text_end = length + len(stripped)
+        length += len(string)
+        if text_end >= limit:
+            break
+    return ''.join(parts)[:min(text_end, limit)]
+
+# Hrefs urllib would rewrite (stripped characters, dropped empty params/query/fragment)
+_URL_REWRITE_RE = re.compile(r'[\t\r\n;]|\?#|[?#]\Z')
+_ABSOLUTE_NETLOC_RE = re.compile(r'https?://([^/?#\[\]]+)(?=[/?#]|\Z)')
+
+def _resolve_link(href, base_url, base_origin, base_netloc):
+    """urljoin(base_url, href) and its netloc, without urllib for plain absolute and root-relative hrefs"""
+    if href.isascii() and not _URL_REWRITE_RE.search(href):
+        if href.startswith('/'):
+            # Dot segments and protocol-relative hrefs need urljoin's resolution
+            if base_origin and not href.startswith('//') and '/.' not in href:
+                return base_origin + href, base_netloc
+        else:
+            match = _ABSOLUTE_NETLOC_RE.match(href)
+            if match:
+                return href, match.group(1)
+    absolute_url = urljoin(base_url, href)
+    return absolute_url, urlparse(absolute_url).netloc
+
+def _img_counts(imgs):
+    """Image attribute counters shared by the accessibility, performance and SEO checks"""
+    without_alt = empty_alt = lazy = srcset = 0
+    for img in imgs:
+        attrs = img.attrs
+        alt = attrs.get('alt')
+        if alt is None:
+            without_alt += 1
+            empty_alt += 1
+        elif not alt:
+            empty_alt += 1
+        if attrs.get('loading') == 'lazy':
+            lazy += 1
+        if 'srcset' in attrs:
+            srcset += 1
+    return {
+        'total': len(imgs),
+        'without_alt': without_alt,
+        'with_alt': len(imgs) - without_alt,
+        'empty_alt': empty_alt,
+        'lazy': lazy,
+        'srcset': srcset
+    }
+
+def _find_meta(metas, attr, value):
+    """First meta tag whose attribute equals value, like soup.find('meta', attrs={attr: value})"""
+    for meta in metas:
+        if meta.get(attr) == value:
+            return meta
+    return None
+
+def _block_heavy_resources(route):
+    """Context route handler that drops BLOCKED_RESOURCE_TYPES requests"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+def _close_probe(probe):
+    """Close the response of a sitemap probe that lost to an earlier location"""
+    if not probe.cancelled() and probe.exception() is None and probe.result() is not None:
+        probe.result().close()
+
+def _cached_fetch(key, fetch, default, *args):
+    """fetch(*args), reusing the result stored under key while it is fresh
+
+    An unreachable host yields default, which is kept for FETCH_FAILURE_TTL
+    so later scrapes of that origin don't wait on it again.
+    """
+    now = time.monotonic()
+    with _fetch_cache_lock:
+        entry = _fetch_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    
+    try:
+        value = fetch(*args)
+        ttl = FETCH_CACHE_TTL
+    except _UNREACHABLE_ERRORS as e:
+        logger.debug(f"Skipping {key[0]} for {key[1]} for {FETCH_FAILURE_TTL}s, host unreachable: {e}")
+        value = default
+        ttl = FETCH_FAILURE_TTL
+    with _fetch_cache_lock:
+        _fetch_cache.pop(key, None)
+        _fetch_cache[key] = (now + ttl, value)
+        while len(_fetch_cache) > FETCH_CACHE_SIZE:
+            del _fetch_cache[next(iter(_fetch_cache))]
+    return value
+
+def _get_browser():
+    """Return the calling thread's Chromium, launching it on first use or after a crash"""
+    browser = getattr(_browser_state, 'browser', None)
+    if browser is None or not browser.is_connected():
+        if browser is not None:
+            logger.warning(f"Browser on {threading.current_thread().name} disconnected, relaunching")
+        if getattr(_browser_state, 'playwright', None) is None:
+            _browser_state.playwright = sync_playwright().start()
+        browser = _browser_state.playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+        _browser_state.browser = browser
+    return browser
+
 class WebScraper:
-    def __init__(self):
-        self.playwright = None
+    def __init__(self, block_resources=True):
         self.browser = None
         self.context = None
+        self.session = None
+        self.block_resources = block_resources
         
     def __enter__(self):
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--no-zygote',
-                '--disable-extensions',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            ]
-        )
+        # Only the context is per-request; the browser is reused across requests
+        self.browser = _get_browser()
         self.context = self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            user_agent=USER_AGENT,
             extra_http_headers={
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
@@ -51,15 +441,15 @@ class WebScraper:
                 'Pragma': 'no-cache'
             }
         )
+        if self.block_resources:
+            self.context.route('**/*', _block_heavy_resources)
+        
+        self.session = _HTTP_SESSION
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.context:
             self.context.close()
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
 
     def minify_data(self, data, level='standard'):
         """
@@ -69,14 +459,10 @@ class WebScraper:
         if isinstance(data, dict) and 'error' in data:
             return data
             
-        minified = data.copy()
-        
-        # Always clean text content
-        minified = self._clean_text_content(minified)
-        
-        if level in ['standard', 'aggressive']:
-            minified = self._remove_empty_values(minified)
-            minified = self._compress_content_arrays(minified)
+        # Always clean text content; standard and aggressive also remove empty
+        # values and compress content arrays in the same pass
+        reduce = level in ['standard', 'aggressive']
+        minified = self._minify_dict(data, prune=reduce, compress=reduce)
             
         if level == 'aggressive':
             minified = self._remove_optional_sections(minified)
@@ -84,70 +470,62 @@ class WebScraper:
             
         return minified
     
-    def _clean_text_content(self, data):
-        """Remove excessive whitespace from text content"""
-        if isinstance(data, dict):
-            cleaned = {}
-            for key, value in data.items():
-                if isinstance(value, str):
-                    # Clean excessive whitespace but preserve single spaces
-                    cleaned[key] = re.sub(r'\s+', ' ', value.strip())
-                else:
-                    cleaned[key] = self._clean_text_content(value)
-            return cleaned
-        elif isinstance(data, list):
-            return [self._clean_text_content(item) for item in data]
-        else:
-            return data
+    def _minify_dict(self, data, prune, compress):
+        """Clean text, and optionally drop empty values and compress 'content' sections, in one pass"""
+        minified = {}
+        for key, value in data.items():
+            if isinstance(value, str):
+                # Clean excessive whitespace but preserve single spaces
+                value = _WS_RE.sub(' ', value.strip())
+                if prune and not value:
+                    value = None
+            elif isinstance(value, dict):
+                is_content = compress and key == 'content'
+                value = self._minify_dict(value, prune, compress and not is_content)
+                if is_content:
+                    value = self._compress_content(value)
+            elif isinstance(value, list):
+                value = self._minify_list(value, prune, compress)
+            # Keep non-empty values or important structural keys
+            if prune and not value and key not in ['status_code', 'timestamp', 'url', 'final_url']:
+                continue
+            minified[key] = value
+        return minified
     
-    def _remove_empty_values(self, data):
-        """Remove empty strings, lists, and dictionaries"""
-        if isinstance(data, dict):
-            cleaned = {}
-            for key, value in data.items():
-                cleaned_value = self._remove_empty_values(value)
-                # Keep non-empty values or important structural keys
-                if cleaned_value or key in ['status_code', 'timestamp', 'url', 'final_url']:
-                    cleaned[key] = cleaned_value
-            return cleaned
-        elif isinstance(data, list):
-            return [self._remove_empty_values(item) for item in data if item]
-        else:
-            return data if data not in ['', [], {}] else None
+    def _minify_list(self, data, prune, compress):
+        """List counterpart of _minify_dict; strings directly inside lists are left as-is"""
+        minified = []
+        for item in data:
+            if prune and not item:
+                continue
+            if isinstance(item, dict):
+                item = self._minify_dict(item, prune, compress)
+            elif isinstance(item, list):
+                item = self._minify_list(item, prune, compress)
+            minified.append(item)
+        return minified
     
-    def _compress_content_arrays(self, data):
-        """Compress large content arrays"""
-        if isinstance(data, dict):
-            compressed = {}
-            for key, value in data.items():
-                if key == 'content' and isinstance(value, dict):
-                    # Compress content section
-                    compressed_content = {}
-                    for content_key, content_value in value.items():
-                        if content_key == 'paragraphs' and isinstance(content_value, list):
-                            # Keep only first 20 paragraphs and add summary
-                            if len(content_value) > 20:
-                                compressed_content[content_key] = content_value[:20]
-                                compressed_content['paragraphs_total'] = len(content_value)
-                            else:
-                                compressed_content[content_key] = content_value
-                        elif content_key == 'text_content':
-                            # Truncate very long text content
-                            if isinstance(content_value, str) and len(content_value) > 5000:
-                                compressed_content[content_key] = content_value[:5000] + '...'
-                                compressed_content['text_content_truncated'] = True
-                            else:
-                                compressed_content[content_key] = content_value
-                        else:
-                            compressed_content[content_key] = content_value
-                    compressed[key] = compressed_content
+    def _compress_content(self, content):
+        """Compress large arrays and text of a content section"""
+        compressed_content = {}
+        for content_key, content_value in content.items():
+            if content_key == 'paragraphs' and isinstance(content_value, list):
+                # Keep only first 20 paragraphs and add summary
+                if len(content_value) > 20:
+                    compressed_content[content_key] = content_value[:20]
+                    compressed_content['paragraphs_total'] = len(content_value)
                 else:
-                    compressed[key] = self._compress_content_arrays(value)
-            return compressed
-        elif isinstance(data, list):
-            return [self._compress_content_arrays(item) for item in data]
-        else:
-            return data
+                    compressed_content[content_key] = content_value
+            elif content_key == 'text_content':
+                # Truncate very long text content
+                if isinstance(content_value, str) and len(content_value) > 5000:
+                    compressed_content[content_key] = content_value[:5000] + '...'
+                    compressed_content['text_content_truncated'] = True
+                else:
+                    compressed_content[content_key] = content_value
+            else:
+                compressed_content[content_key] = content_value
+        return compressed_content
     
     def _remove_optional_sections(self, data):
         """Remove optional sections for aggressive minification"""
@@ -200,27 +578,14 @@ class WebScraper:
         else:
             return data
 
-    def scrape_website(self, url):
+    def scrape_website(self, url, wait_ms=0):
         """Enhanced website scraping with comprehensive data extraction"""
         start_time = time.time()
         
         try:
             page = self.context.new_page()
-            
-            # Track response for headers and performance
-            response_info = {}
-            navigation_start = None
-            
-            def handle_response(response):
-                nonlocal navigation_start
-                if response.url == url or response.url.rstrip('/') == url.rstrip('/'):
-                    response_info['headers'] = dict(response.headers)
-                    response_info['status'] = response.status
-                    response_info['url'] = response.url
-                    if not navigation_start:
-                        navigation_start = time.time()
-            
-            page.on('response', handle_response)
+            # Tracked from the start so requests spanning the waits below are counted
+            network = _track_requests(page)
             
             # Navigate to page with better error handling
             try:
@@ -230,74 +595,97 @@ class WebScraper:
                 logger.warning(f"NetworkIdle failed for {url}, trying domcontentloaded: {str(e)}")
                 response = page.goto(url, wait_until='domcontentloaded', timeout=30000)
             
-            # Wait for additional JS rendering and lazy loading
-            page.wait_for_timeout(5000)
+            # Start fetching external resources now so they overlap with the
+            # rendering waits and the extraction below; both only depend on the origin
+            origin = urljoin(page.url, '/')
+            futures = {
+                _FETCH_POOL.submit(_cached_fetch, ('robots_txt', origin), self._get_robots_txt, None, page.url): 'robots_txt',
+                _FETCH_POOL.submit(_cached_fetch, ('sitemap', origin), self._get_sitemap_data, [], page.url): 'sitemap'
+            }
             
-            # Try to trigger lazy loading by scrolling
+            # Wait for additional JS rendering to stop fetching; returns at once after a
+            # networkidle goto(), and only waits on the domcontentloaded fallback path
             try:
-                page.evaluate("""
-                    // Scroll to different positions to trigger lazy loading
-                    const positions = [0.25, 0.5, 0.75, 1];
-                    for (let i = 0; i < positions.length; i++) {
-                        setTimeout(() => {
-                            window.scrollTo(0, document.body.scrollHeight * positions[i]);
-                        }, i * 500);
-                    }
-                    setTimeout(() => window.scrollTo(0, 0), 2500);
-                """)
-                page.wait_for_timeout(3000)
-            except:
+                _wait_for_network_quiet(page, network, SETTLE_TIMEOUT_MS)
+            except Exception:
+                pass
+            
+            # Try to trigger lazy loading by scrolling; each step waits until two animation
+            # frames have rendered at that position (so intersection observers and scroll
+            # handlers run), or SETTLE_TIMEOUT_MS if the page stops producing frames
+            try:
+                for position in SCROLL_POSITIONS:
+                    page.evaluate(_SCROLL_STEP_JS, [position, SETTLE_TIMEOUT_MS])
+                page.evaluate("window.scrollTo(0, 0)")
+                # Let the requests the scroll started finish: the page's networkidle state has
+                # already fired and is not re-armed, so watch the request events ourselves
+                _wait_for_network_quiet(page, network, SETTLE_TIMEOUT_MS)
+            except Exception:
                 pass
             
-            # Get basic page info
+            # Optional extra settle time requested by the caller
+            if wait_ms:
+                page.wait_for_timeout(wait_ms)
+            
+            # Get basic page info; goto() returns the main document response after redirects
             final_url = page.url
+            response_headers = dict(response.headers) if response else {}
+            parsed_url = urlparse(final_url)
             status_code = response.status if response else None
             
             # Get page content with better encoding handling
             html_content = page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
+            try:
+                soup = BeautifulSoup(html_content, 'lxml')
+            except FeatureNotFound:
+                # lxml not installed, fall back to the pure-Python parser
+                soup = BeautifulSoup(html_content, 'html.parser')
             
             # Performance metrics
-            load_time = time.time() - start_time if navigation_start else None
+            load_time = time.time() - start_time if response else None
+            
+            # Bucket all tags once so extractors don't each re-walk the tree
+            tags = self._walk_once(soup)
+            
+            # Page text and HTML size, shared by the content, business and SEO extractors
+            full_text = soup.get_text()
+            html_size = len(html_content)
+            img_counts = _img_counts(tags['img'])
+            
+            meta_data, social_data = self._extract_meta_and_social(tags)
             
             # Extract all data with comprehensive analysis
             data = {
                 'url': url,
                 'final_url': final_url,
                 'status_code': status_code,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _timestamp(),
                 'load_time_total': load_time,
-                'page_info': self._extract_page_info(page, soup),
-                'meta_data': self._extract_meta_data(soup),
-                'structured_data': self._extract_structured_data(soup),
-                'social_media': self._extract_social_media_data(soup),
-                'content': self._extract_content_comprehensive(soup),
-                'technical': self._extract_technical_data(page, soup, response_info),
-                'seo': self._extract_seo_data(soup),
-                'links': self._extract_links(soup, final_url),
-                'images': self._extract_images(soup, final_url),
-                'forms': self._extract_forms(soup),
-                'business_info': self._extract_business_info(soup),
-                'contact_info': self._extract_contact_info(soup),
-                'page_structure': self._analyze_page_structure(soup),
+                'page_info': self._extract_page_info(final_url, parsed_url, tags),
+                'meta_data': meta_data,
+                'structured_data': self._extract_structured_data(tags),
+                'social_media': social_data,
+                'content': self._extract_content_comprehensive(soup, tags, full_text, html_size),
+                'technical': self._extract_technical_data(page, soup, tags, img_counts, response_headers, html_content),
+                'seo': self._extract_seo_data(tags, img_counts, full_text, html_size),
+                'links': self._extract_links(tags, final_url, parsed_url),
+                'images': self._extract_images(tags, final_url),
+                'forms': self._extract_forms(tags),
+                'business_info': self._extract_business_info(tags, full_text),
+                'contact_info': self._extract_contact_info(tags),
+                'page_structure': self._analyze_page_structure(soup, tags),
                 'robots_txt': None,
                 'sitemap': None
             }
             
-            # Fetch external resources in parallel (excluding screenshot)
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                futures = {
-                    executor.submit(self._get_robots_txt, final_url): 'robots_txt',
-                    executor.submit(self._get_sitemap_data, final_url): 'sitemap'
-                }
-                
-                for future in as_completed(futures, timeout=30):
-                    key = futures[future]
-                    try:
-                        data[key] = future.result()
-                    except Exception as exc:
-                        logger.warning(f'{key} generation failed: {exc}')
-                        data[key] = None
+            # Collect the external resources started after navigation
+            for future in as_completed(futures, timeout=30):
+                key = futures[future]
+                try:
+                    data[key] = future.result()
+                except Exception as exc:
+                    logger.warning(f'{key} generation failed: {exc}')
+                    data[key] = None
             
             # Update SEO data with link counts
             if 'seo' in data and 'links' in data:
@@ -309,9 +697,27 @@ class WebScraper:
             
         except Exception as e:
             logger.error(f"Error scraping {url}: {str(e)}")
-            return {'error': str(e), 'url': url, 'timestamp': datetime.now().isoformat()}
+            return {'error': str(e), 'url': url, 'timestamp': _timestamp()}
 
-    def _extract_content_comprehensive(self, soup):
+    def _walk_once(self, soup):
+        """Bucket every tag by name (plus _TAG_GROUPS and _ATTR_BUCKETS) in a single document traversal"""
+        tags = defaultdict(list)
+        for el in soup.descendants:
+            name = el.name
+            if name is None:
+                continue
+            tags[name].append(el)
+            group = _TAG_GROUPS.get(name)
+            if group:
+                tags[group].append(el)
+            attrs = el.attrs
+            if attrs:
+                for attr, key in _ATTR_BUCKETS.items():
+                    if attr in attrs:
+                        tags[key].append(el)
+        return tags
+
+    def _extract_content_comprehensive(self, soup, tags, full_text, html_size):
         """Extract comprehensive content with detailed analysis"""
         content = {
             'headings': {},
@@ -331,7 +737,7 @@ class WebScraper:
         
         # Headings with hierarchy and additional info
         for i in range(1, 7):
-            headings = soup.find_all(f'h{i}')
+            headings = tags[f'h{i}']
             heading_data = []
             for h in headings:
                 if h.text.strip():
@@ -345,20 +751,19 @@ class WebScraper:
                 content['headings'][f'h{i}'] = heading_data
         
         # Enhanced paragraphs with context
-        paragraphs = soup.find_all('p')
-        for p in paragraphs:
+        for p in tags['p']:
             text = p.text.strip()
             if text and len(text) > 5:  # Filter out very short paragraphs
                 para_info = {
                     'text': text,
                     'length': len(text),
-                    'word_count': len(text.split()),
+                    'word_count': _count_words(text),
                     'parent_tag': p.parent.name if p.parent else None
                 }
                 content['paragraphs'].append(para_info)
         
         # Enhanced lists with structure
-        for ul in soup.find_all(['ul', 'ol']):
+        for ul in tags['ul,ol']:
             list_items = []
             for li in ul.find_all('li', recursive=False):  # Only direct children
                 text = li.text.strip()
@@ -378,7 +783,7 @@ class WebScraper:
                 })
         
         # Enhanced tables
-        for table in soup.find_all('table'):
+        for table in tags['table']:
             table_data = {
                 'headers': [],
                 'rows': [],
@@ -391,68 +796,62 @@ class WebScraper:
             if caption:
                 table_data['caption'] = caption.text.strip()
             
-            # Headers from thead or first row
+            # Headers from thead or first row (limit columns; find_all stops at the limit)
             thead = table.find('thead')
             if thead:
-                headers = thead.find_all(['th', 'td'])
+                headers = thead.find_all(['th', 'td'], limit=10)
             else:
                 # Try first row
                 first_row = table.find('tr')
-                headers = first_row.find_all('th') if first_row else []
+                headers = first_row.find_all('th', limit=10) if first_row else []
             
             if headers:
-                table_data['headers'] = [th.text.strip() for th in headers[:10]]  # Limit columns
+                table_data['headers'] = [th.text.strip() for th in headers]
             
             # Rows (limit to first 10 for size)
-            rows = table.find_all('tr')[:10]
+            rows = table.find_all('tr', limit=10)
             for row in rows:
-                cells = row.find_all(['td', 'th'])
+                cells = row.find_all(['td', 'th'], limit=10)  # Limit columns
                 if cells:
-                    row_data = [cell.text.strip() for cell in cells[:10]]  # Limit columns
+                    row_data = [cell.text.strip() for cell in cells]
                     if any(row_data):  # Only include non-empty rows
                         table_data['rows'].append(row_data)
             
             if table_data['headers'] or table_data['rows']:
                 content['tables'].append(table_data)
         
-        # Text blocks analysis
-        main_content_selectors = ['main', 'article', '.content', '.main', '#content', '#main']
-        sidebar_selectors = ['aside', '.sidebar', '.side', '#sidebar']
-        nav_selectors = ['nav', '.navigation', '.nav', '#navigation', '#nav']
-        footer_selectors = ['footer', '.footer', '#footer']
-        
         # Extract main content
-        for selector in main_content_selectors:
-            main_elem = soup.select_one(selector)
+        for selector in MAIN_CONTENT_SELECTORS:
+            main_elem = self._select_first(soup, tags, selector)
             if main_elem:
-                content['main_content'] = main_elem.text.strip()[:2000]  # Limit length
+                content['main_content'] = _bounded_text(main_elem, 2000)  # Limit length
                 break
         
         # Extract sidebar content
-        for selector in sidebar_selectors:
-            sidebar_elem = soup.select_one(selector)
+        for selector in SIDEBAR_SELECTORS:
+            sidebar_elem = self._select_first(soup, tags, selector)
             if sidebar_elem:
-                content['sidebar_content'] = sidebar_elem.text.strip()[:1000]
+                content['sidebar_content'] = _bounded_text(sidebar_elem, 1000)
                 break
         
         # Extract navigation content
-        for selector in nav_selectors:
-            nav_elem = soup.select_one(selector)
+        for selector in NAV_SELECTORS:
+            nav_elem = self._select_first(soup, tags, selector)
             if nav_elem:
-                content['navigation_content'] = nav_elem.text.strip()[:500]
+                content['navigation_content'] = _bounded_text(nav_elem, 500)
                 break
         
         # Extract footer content
-        for selector in footer_selectors:
-            footer_elem = soup.select_one(selector)
+        for selector in FOOTER_SELECTORS:
+            footer_elem = self._select_first(soup, tags, selector)
             if footer_elem:
-                content['footer_content'] = footer_elem.text.strip()[:500]
+                content['footer_content'] = _bounded_text(footer_elem, 500)
                 break
         
         # Text blocks by semantic areas
         content_areas = ['header', 'main', 'article', 'section', 'aside', 'footer']
         for area in content_areas:
-            elements = soup.find_all(area)
+            elements = tags[area]
             if elements:
                 area_text = []
                 for elem in elements[:3]:  # Limit to first 3 of each type
@@ -461,7 +860,7 @@ class WebScraper:
                         area_text.append({
                             'tag': area,
                             'text': text[:500],  # Limit length
-                            'word_count': len(text.split()),
+                            'word_count': _count_words(text),
                             'id': elem.get('id'),
                             'class': elem.get('class')
                         })
@@ -469,19 +868,25 @@ class WebScraper:
                     content['text_blocks'].extend(area_text)
         
         # Full text content with better cleaning
-        text_soup = soup.get_text()
-        content['text_content'] = re.sub(r'\s+', ' ', text_soup).strip()
-        content['word_count'] = len(content['text_content'].split())
+        content['text_content'] = _WS_RE.sub(' ', full_text).strip()
+        # text_content is whitespace-normalized, so words are exactly the spaces plus one
+        text_content = content['text_content']
+        content['word_count'] = text_content.count(' ') + 1 if text_content else 0
         content['reading_time'] = max(1, content['word_count'] // 200)  # 200 words per minute
         
         # Text density (ratio of text to HTML)
-        html_size = len(str(soup))
         text_size = len(content['text_content'])
         content['text_density'] = round(text_size / html_size, 3) if html_size > 0 else 0
         
         return content
 
-    def _extract_business_info(self, soup):
+    def _select_first(self, soup, tags, selector):
+        """soup.select_one(selector) for a content-area selector, via the tag buckets or _COMPILED_SELECTORS"""
+        if selector.isalnum():
+            return tags[selector][0] if tags[selector] else None
+        return _COMPILED_SELECTORS[selector].select_one(soup)
+
+    def _extract_business_info(self, tags, full_text):
         """Extract business-specific information"""
         business_info = {
             'company_name': '',
@@ -495,58 +900,44 @@ class WebScraper:
         }
         
         # Company name from various sources
-        title = soup.find('title')
-        if title:
-            business_info['company_name'] = title.text.strip()
-        
-        # Address patterns
-        address_patterns = [
-            r'\d+\s+[A-Za-z\s]+(?:street|str|avenue|ave|road|rd|drive|dr|lane|ln|boulevard|blvd).*?\d{4,5}',
-            r'\d{4,5}\s+[A-Z]{2}\s+[A-Za-z\s]+',  # Dutch postal codes
-            r'[A-Za-z\s]+\s+\d+[A-Za-z]?\s*,\s*\d{4,5}\s+[A-Za-z\s]+',
-        ]
-        
-        text_content = soup.get_text()
-        for pattern in address_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
+        if tags['title']:
+            business_info['company_name'] = tags['title'][0].text.strip()
+        
+        # Address patterns; dicts serve as insertion-ordered sets
+        text_content = full_text
+        addresses = {}
+        for pattern in _ADDRESS_PATTERNS:
+            matches = pattern.findall(text_content)
             for match in matches[:3]:  # Limit to 3 addresses
-                if match not in business_info['addresses']:
-                    business_info['addresses'].append(match.strip())
-        
-        # Phone numbers (enhanced patterns)
-        phone_patterns = [
-            r'(\+31\s?(?:\(0\)\s?)?[1-9](?:\s?\d){8})',  # Dutch format
-            r'(\+\d{1,3}\s?\d{1,14})',  # International
-            r'(\b0\d{1,3}[-\s]?\d{6,7}\b)',  # Local Dutch
-            r'(\b\d{3,4}[-\s]?\d{6,7}\b)'  # Local format
-        ]
+                addresses.setdefault(match.strip(), None)
+        business_info['addresses'] = list(addresses)
         
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text_content)
+        # Phone numbers (enhanced patterns), deduplicated on their digits
+        phones = {}
+        for literal, pattern in _PHONE_PATTERNS:
+            if literal not in text_content:
+                continue
+            matches = pattern.findall(text_content)
             for match in matches[:5]:  # Limit to 5 phone numbers
-                clean_phone = re.sub(r'[^\d+]', '', match)
-                if len(clean_phone) >= 8 and clean_phone not in business_info['phone_numbers']:
-                    business_info['phone_numbers'].append(match.strip())
+                clean_phone = _PHONE_STRIP_RE.sub('', match)
+                if len(clean_phone) >= 8:
+                    phones.setdefault(clean_phone, match.strip())
+        business_info['phone_numbers'] = list(phones.values())
         
         # Email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text_content)
-        business_info['email_addresses'] = list(set(emails))[:5]  # Limit to 5 unique emails
+        emails = _EMAIL_RE.findall(text_content) if '@' in text_content else []
+        business_info['email_addresses'] = list(dict.fromkeys(emails))[:5]  # Limit to 5 unique emails
         
         # Business hours patterns
-        hours_patterns = [
-            r'(?:open|hours?|tijd|tijden).*?(?:\d{1,2}:\d{2}|\d{1,2}\s*(?:am|pm))',
-            r'(?:maandag|monday|ma).*?(?:vrijdag|friday|vr).*?\d{1,2}:\d{2}',
-            r'\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}'
-        ]
-        
-        for pattern in hours_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
+        for literal, pattern in _HOURS_PATTERNS:
+            if literal not in text_content:
+                continue
+            matches = pattern.findall(text_content)
             business_info['business_hours'].extend(matches[:3])
         
         return business_info
 
-    def _extract_contact_info(self, soup):
+    def _extract_contact_info(self, tags):
         """Extract contact information comprehensively"""
         contact_info = {
             'contact_forms': [],
@@ -557,8 +948,7 @@ class WebScraper:
         }
         
         # Contact forms
-        forms = soup.find_all('form')
-        for form in forms:
+        for form in tags['form']:
             form_info = {
                 'action': form.get('action', ''),
                 'method': form.get('method', 'get').lower(),
@@ -586,35 +976,35 @@ class WebScraper:
             
             contact_info['contact_forms'].append(form_info)
         
-        # Contact page links
-        contact_links = soup.find_all('a', href=True)
-        for link in contact_links:
-            href = link.get('href', '').lower()
-            text = link.text.lower().strip()
-            if any(word in href or word in text for word in ['contact', 'about', 'over']):
+        # Contact page and social media links, in one pass over the anchors
+        seen_social = set()
+        for link in tags['a']:
+            href = link.get('href')
+            if href is None:
+                continue
+            text = link.text.strip()
+            href_lower = href.lower()
+            text_lower = text.lower()
+            if any(word in href_lower or word in text_lower for word in ['contact', 'about', 'over']):
                 contact_info['contact_pages'].append({
-                    'url': link.get('href'),
-                    'text': link.text.strip()
+                    'url': href,
+                    'text': text
                 })
-        
-        # Social media links
-        social_domains = ['facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com', 
-                         'youtube.com', 'tiktok.com', 'pinterest.com']
-        
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            for domain in social_domains:
+            
+            if href in seen_social:
+                continue
+            for domain, platform in _CONTACT_SOCIAL_DOMAINS:
                 if domain in href:
+                    seen_social.add(href)
                     contact_info['social_links'].append({
-                        'platform': domain.replace('.com', ''),
+                        'platform': platform,
                         'url': href,
-                        'text': link.text.strip()
+                        'text': text
                     })
                     break
         
         # Map embeds
-        iframes = soup.find_all('iframe')
-        for iframe in iframes:
+        for iframe in tags['iframe']:
             src = iframe.get('src', '')
             if 'maps' in src or 'embed' in src:
                 contact_info['map_embeds'].append({
@@ -625,14 +1015,14 @@ class WebScraper:
         
         return contact_info
 
-    def _analyze_page_structure(self, soup):
+    def _analyze_page_structure(self, soup, tags):
         """Analyze the overall structure of the page"""
         structure = {
-            'has_header': bool(soup.find('header')),
-            'has_nav': bool(soup.find('nav')),
-            'has_main': bool(soup.find('main')),
-            'has_aside': bool(soup.find('aside')),
-            'has_footer': bool(soup.find('footer')),
+            'has_header': bool(tags['header']),
+            'has_nav': bool(tags['nav']),
+            'has_main': bool(tags['main']),
+            'has_aside': bool(tags['aside']),
+            'has_footer': bool(tags['footer']),
             'semantic_elements': [],
             'content_sections': 0,
             'navigation_items': 0,
@@ -643,7 +1033,7 @@ class WebScraper:
         # Count semantic elements
         semantic_tags = ['header', 'nav', 'main', 'article', 'section', 'aside', 'footer']
         for tag in semantic_tags:
-            elements = soup.find_all(tag)
+            elements = tags[tag]
             if elements:
                 structure['semantic_elements'].append({
                     'tag': tag,
@@ -651,85 +1041,131 @@ class WebScraper:
                 })
         
         # Count content sections
-        structure['content_sections'] = len(soup.find_all(['article', 'section']))
+        structure['content_sections'] = len(tags['article']) + len(tags['section'])
         
         # Count navigation items
-        nav_links = soup.select('nav a, .nav a, .navigation a')
+        nav_links = _NAV_LINKS_SELECTOR.select(soup)
         structure['navigation_items'] = len(nav_links)
         
-        # Total elements
-        structure['total_elements'] = len(soup.find_all())
+        # Total elements (group and attribute buckets hold tags already counted under their own name)
+        structure['total_elements'] = sum(len(elems) for name, elems in tags.items()
+                                          if ',' not in name and not name.startswith('['))
         
-        # Depth analysis
-        def get_max_depth(element, current_depth=0):
-            if not element.children:
-                return current_depth
-            return max(get_max_depth(child, current_depth + 1) 
-                      for child in element.children 
-                      if hasattr(child, 'children'))
-        
-        try:
-            structure['depth_analysis']['max_nesting_depth'] = get_max_depth(soup.body) if soup.body else 0
-        except:
-            structure['depth_analysis']['max_nesting_depth'] = 0
+        # Depth analysis: deepest tag below <body>, walked iteratively so deep pages can't hit the recursion limit
+        max_depth = 0
+        stack = [(soup.body, 0)] if soup.body else []
+        while stack:
+            element, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            stack.extend((child, depth + 1) for child in element.children if hasattr(child, 'children'))
+        structure['depth_analysis']['max_nesting_depth'] = max_depth
         
         return structure
 
     # Keep existing methods for page_info, meta_data, etc. but enhance them
-    def _extract_page_info(self, page, soup):
+    def _extract_page_info(self, url, parsed, tags):
         """Extract enhanced page information"""
-        title_elem = soup.find('title')
+        metas = tags['meta']
+        title_elem = tags['title'][0] if tags['title'] else None
         
         # Get language from html tag or meta
-        lang = soup.find('html', lang=True)
+        lang = next((html for html in tags['html'] if 'lang' in html.attrs), None)
         lang = lang.get('lang') if lang else None
         if not lang:
-            lang_meta = soup.find('meta', attrs={'http-equiv': 'content-language'})
+            lang_meta = _find_meta(metas, 'http-equiv', 'content-language')
             lang = lang_meta.get('content') if lang_meta else None
         
         # Get additional page info
-        charset_meta = soup.find('meta', charset=True)
+        charset_meta = next((meta for meta in metas if 'charset' in meta.attrs), None)
         charset = charset_meta.get('charset') if charset_meta else 'utf-8'
         
         return {
             'title': title_elem.text.strip() if title_elem else '',
             'title_length': len(title_elem.text.strip()) if title_elem else 0,
-            'url': page.url,
-            'domain': urlparse(page.url).netloc,
-            'subdomain': urlparse(page.url).netloc.split('.')[0] if '.' in urlparse(page.url).netloc else '',
-            'path': urlparse(page.url).path,
-            'path_segments': [seg for seg in urlparse(page.url).path.split('/') if seg],
-            'query': urlparse(page.url).query,
-            'fragment': urlparse(page.url).fragment,
-            'protocol': urlparse(page.url).scheme,
+            'url': url,
+            'domain': parsed.netloc,
+            'subdomain': parsed.netloc.split('.')[0] if '.' in parsed.netloc else '',
+            'path': parsed.path,
+            'path_segments': [seg for seg in parsed.path.split('/') if seg],
+            'query': parsed.query,
+            'fragment': parsed.fragment,
+            'protocol': parsed.scheme,
             'language': lang,
             'charset': charset,
-            'is_ssl': page.url.startswith('https://'),
-            'url_length': len(page.url)
+            'is_ssl': url.startswith('https://'),
+            'url_length': len(url)
         }
 
-    def _extract_meta_data(self, soup):
-        """Extract comprehensive meta data"""
+    def _extract_meta_and_social(self, tags):
+        """Extract comprehensive meta data and social media tags in one pass over <meta>"""
         meta_data = {}
+        social_data = {
+            'open_graph': {},
+            'twitter_cards': {},
+            'facebook': {},
+            'linkedin': {},
+            'pinterest': {},
+            'summary': {}
+        }
+        links = tags['link']
         
-        # Standard meta tags
-        for meta in soup.find_all('meta'):
-            name = meta.get('name') or meta.get('property') or meta.get('http-equiv')
+        for meta in tags['meta']:
             content = meta.get('content')
-            if name and content:
-                # Clean content
-                content = re.sub(r'\s+', ' ', content.strip())
+            if not content:
+                continue
+            
+            # Clean content
+            content = _WS_RE.sub(' ', content.strip())
+            property_attr = meta.get('property', '')
+            name_attr = meta.get('name', '')
+            
+            # Standard meta tags
+            name = name_attr or property_attr or meta.get('http-equiv')
+            if name:
                 meta_data[name.lower()] = content
+            
+            # Open Graph
+            if property_attr.startswith('og:'):
+                social_data['open_graph'][property_attr[3:]] = content
+            
+            # Twitter Cards
+            elif name_attr.startswith('twitter:'):
+                social_data['twitter_cards'][name_attr[8:]] = content
+            
+            # Facebook specific
+            elif property_attr.startswith('fb:'):
+                social_data['facebook'][property_attr[3:]] = content
+            
+            # LinkedIn
+            elif property_attr.startswith('linkedin:'):
+                social_data['linkedin'][property_attr[9:]] = content
+            
+            # Pinterest
+            elif name_attr.startswith('pinterest'):
+                social_data['pinterest'][name_attr] = content
+        
+        # Create social summary
+        social_data['summary'] = {
+            'has_open_graph': bool(social_data['open_graph']),
+            'has_twitter_cards': bool(social_data['twitter_cards']),
+            'has_facebook_meta': bool(social_data['facebook']),
+            'total_social_tags': (len(social_data['open_graph']) + 
+                                 len(social_data['twitter_cards']) + 
+                                 len(social_data['facebook']) + 
+                                 len(social_data['linkedin']) + 
+                                 len(social_data['pinterest']))
+        }
         
         # Canonical URL
-        canonical = soup.find('link', rel='canonical')
+        canonical = next((link for link in links if _rel_matches(link, ('canonical',))), None)
         if canonical:
             meta_data['canonical'] = canonical.get('href')
             
         # Alternative languages
         alt_langs = []
-        for link in soup.find_all('link', rel='alternate'):
-            if link.get('hreflang'):
+        for link in links:
+            if _rel_matches(link, ('alternate',)) and link.get('hreflang'):
                 alt_langs.append({
                     'hreflang': link.get('hreflang'),
                     'href': link.get('href'),
@@ -740,7 +1176,10 @@ class WebScraper:
         
         # Favicon analysis
         favicon_links = []
-        for link in soup.find_all('link', rel=['icon', 'shortcut icon', 'apple-touch-icon', 'apple-touch-icon-precomposed']):
+        favicon_rels = ('icon', 'shortcut icon', 'apple-touch-icon', 'apple-touch-icon-precomposed')
+        for link in links:
+            if not _rel_matches(link, favicon_rels):
+                continue
             favicon_data = {
                 'rel': link.get('rel'),
                 'href': link.get('href'),
@@ -753,71 +1192,76 @@ class WebScraper:
         
         # CSS and JS resources (enhanced)
         stylesheets = []
-        for link in soup.find_all('link', rel='stylesheet'):
-            if link.get('href'):
+        for link in links:
+            if _rel_matches(link, ('stylesheet',)) and link.get('href'):
                 stylesheets.append({
                     'href': link.get('href'),
                     'media': link.get('media', 'all'),
                     'type': link.get('type', 'text/css'),
-                    'is_external': link.get('href', '').startswith(('http', '//'))
+                    'is_external': link.get('href', '').startswith(_EXTERNAL_URL_PREFIXES)
                 })
         if stylesheets:
             meta_data['stylesheets'] = stylesheets[:15]  # Limit to first 15
         
         # JavaScript files
         scripts = []
-        for script in soup.find_all('script', src=True):
+        for script in tags['script']:
+            if 'src' not in script.attrs:
+                continue
             scripts.append({
                 'src': script.get('src'),
                 'type': script.get('type', 'text/javascript'),
                 'async': script.has_attr('async'),
                 'defer': script.has_attr('defer'),
-                'is_external': script.get('src', '').startswith(('http', '//'))
+                'is_external': script.get('src', '').startswith(_EXTERNAL_URL_PREFIXES)
             })
         if scripts:
             meta_data['external_scripts'] = scripts[:15]  # Limit to first 15
         
-        return meta_data
+        return meta_data, social_data
 
-    def _extract_structured_data(self, soup):
+    def _extract_structured_data(self, tags):
         """Extract structured data with enhanced parsing"""
         structured_data = {
             'json_ld': [],
             'microdata': [],
-            'rdfa': [],
-            'schema_types': []
+            'rdfa': []
         }
+        # Collected as a set; duplicates are common across JSON-LD, microdata and RDFa
+        schema_types = set()
         
         # JSON-LD with error handling and type detection
-        for script in soup.find_all('script', type='application/ld+json'):
+        for script in tags['script']:
+            if script.get('type') != 'application/ld+json':
+                continue
             try:
                 if script.string:
-                    json_str = script.string.strip()
-                    data = json.loads(json_str)
+                    # orjson needs exact str/bytes (not NavigableString) and skips surrounding
+                    # whitespace itself, so encode once instead of strip() + str()
+                    data = orjson.loads(script.string.encode('utf-8', 'replace'))
                     structured_data['json_ld'].append(data)
                     
                     # Extract schema types
                     if isinstance(data, dict) and '@type' in data:
-                        structured_data['schema_types'].append(data['@type'])
+                        schema_types.add(data['@type'])
                     elif isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict) and '@type' in item:
-                                structured_data['schema_types'].append(item['@type'])
-            except (json.JSONDecodeError, ValueError) as e:
+                        schema_types.update(item['@type'] for item in data
+                                            if isinstance(item, dict) and '@type' in item)
+            except orjson.JSONDecodeError as e:
                 logger.debug(f"Failed to parse JSON-LD: {e}")
                 continue
         
         # Enhanced Microdata extraction
-        for elem in soup.find_all(attrs={'itemscope': True}):
+        for elem in tags['[itemscope]']:
             item = self._extract_microdata_item(elem)
             if item and item.get('properties'):
                 structured_data['microdata'].append(item)
                 # Add to schema types if available
                 if item.get('type'):
-                    structured_data['schema_types'].append(item['type'])
+                    schema_types.add(item['type'])
         
         # Enhanced RDFa extraction
-        for elem in soup.find_all(attrs={'typeof': True}):
+        for elem in tags['[typeof]']:
             rdfa_item = {
                 'typeof': elem.get('typeof'),
                 'properties': {},
@@ -838,10 +1282,9 @@ class WebScraper:
                 structured_data['rdfa'].append(rdfa_item)
                 # Add to schema types
                 if rdfa_item['typeof']:
-                    structured_data['schema_types'].append(rdfa_item['typeof'])
+                    schema_types.add(rdfa_item['typeof'])
         
-        # Remove duplicates from schema types
-        structured_data['schema_types'] = list(set(structured_data['schema_types']))
+        structured_data['schema_types'] = list(schema_types)
         
         return structured_data
 
@@ -881,184 +1324,154 @@ class WebScraper:
             
         return item
 
-    def _extract_social_media_data(self, soup):
-        """Extract social media data with enhanced coverage"""
-        social_data = {
-            'open_graph': {},
-            'twitter_cards': {},
-            'facebook': {},
-            'linkedin': {},
-            'pinterest': {},
-            'summary': {}
-        }
-        
-        for meta in soup.find_all('meta'):
-            property_attr = meta.get('property', '')
-            name_attr = meta.get('name', '')
-            content = meta.get('content', '')
-            
-            if not content:
-                continue
-            
-            # Clean content
-            content = re.sub(r'\s+', ' ', content.strip())
-            
-            # Open Graph
-            if property_attr.startswith('og:'):
-                social_data['open_graph'][property_attr[3:]] = content
-            
-            # Twitter Cards
-            elif name_attr.startswith('twitter:'):
-                social_data['twitter_cards'][name_attr[8:]] = content
-            
-            # Facebook specific
-            elif property_attr.startswith('fb:'):
-                social_data['facebook'][property_attr[3:]] = content
-            
-            # LinkedIn
-            elif property_attr.startswith('linkedin:'):
-                social_data['linkedin'][property_attr[9:]] = content
-            
-            # Pinterest
-            elif name_attr.startswith('pinterest'):
-                social_data['pinterest'][name_attr] = content
-        
-        # Create summary
-        social_data['summary'] = {
-            'has_open_graph': bool(social_data['open_graph']),
-            'has_twitter_cards': bool(social_data['twitter_cards']),
-            'has_facebook_meta': bool(social_data['facebook']),
-            'total_social_tags': (len(social_data['open_graph']) + 
-                                 len(social_data['twitter_cards']) + 
-                                 len(social_data['facebook']) + 
-                                 len(social_data['linkedin']) + 
-                                 len(social_data['pinterest']))
-        }
-                
-        return social_data
-
-    def _extract_technical_data(self, page, soup, response_info):
+    def _extract_technical_data(self, page, soup, tags, img_counts, headers, html_content):
         """Extract technical data with enhanced metrics"""
         try:
             # Performance timing
-            perf_data = page.evaluate("""
+            # Serialized in the page and decoded with orjson rather than by the driver
+            perf_data = orjson.loads(page.evaluate("""
                 () => {
                     const timing = performance.timing;
                     const navigation = performance.navigation;
-                    return {
+                    const paint = {};
+                    for (const entry of performance.getEntriesByType('paint')) {
+                        paint[entry.name] = entry.startTime;
+                    }
+                    return JSON.stringify({
                         loadTime: timing.loadEventEnd - timing.navigationStart,
                         domContentLoaded: timing.domContentLoadedEventEnd - timing.navigationStart,
-                        firstPaint: performance.getEntriesByType('paint').find(p => p.name === 'first-paint')?.startTime || null,
-                        firstContentfulPaint: performance.getEntriesByType('paint').find(p => p.name === 'first-contentful-paint')?.startTime || null,
+                        firstPaint: paint['first-paint'] || null,
+                        firstContentfulPaint: paint['first-contentful-paint'] || null,
                         navigationType: navigation.type,
                         redirectCount: navigation.redirectCount
-                    };
+                    });
                 }
-            """)
+            """))
         except Exception as e:
             logger.debug(f"Performance timing failed: {e}")
             perf_data = {}
         
         return {
             'performance': perf_data,
-            'html_size': len(str(soup)),
-            'html_size_kb': round(len(str(soup)) / 1024, 2),
-            'response_headers': response_info.get('headers', {}),
+            'html_size': len(html_content),
+            'html_size_kb': round(len(html_content) / 1024, 2),
+            'response_headers': headers,
             'security': {
                 'https': page.url.startswith('https://'),
-                'mixed_content': self._check_mixed_content(soup, page.url),
-                'hsts_header': 'strict-transport-security' in response_info.get('headers', {}),
-                'csp_header': 'content-security-policy' in response_info.get('headers', {}),
-                'x_frame_options': response_info.get('headers', {}).get('x-frame-options'),
-                'x_content_type_options': response_info.get('headers', {}).get('x-content-type-options'),
-                'referrer_policy': response_info.get('headers', {}).get('referrer-policy')
+                'mixed_content': self._check_mixed_content(tags, page.url),
+                'hsts_header': 'strict-transport-security' in headers,
+                'csp_header': 'content-security-policy' in headers,
+                'x_frame_options': headers.get('x-frame-options'),
+                'x_content_type_options': headers.get('x-content-type-options'),
+                'referrer_policy': headers.get('referrer-policy')
             },
-            'mobile_friendly': self._check_mobile_friendly(soup),
-            'accessibility': self._check_accessibility(soup),
-            'page_speed_insights': self._basic_performance_metrics(soup),
+            'mobile_friendly': self._check_mobile_friendly(tags, img_counts),
+            'accessibility': self._check_accessibility(tags, img_counts),
+            'page_speed_insights': self._basic_performance_metrics(tags, img_counts),
             'encoding': soup.original_encoding if hasattr(soup, 'original_encoding') else 'unknown',
             'doctype': str(soup.doctype) if soup.doctype else 'html5'
         }
 
-    def _check_mixed_content(self, soup, url):
+    def _check_mixed_content(self, tags, url):
         """Check for mixed content issues"""
         if not url.startswith('https://'):
             return []
             
         mixed_content = []
-        for elem in soup.find_all(['img', 'script', 'link', 'iframe', 'audio', 'video']):
+        seen = set()
+        for elem in tags['img,script,link,iframe,audio,video']:
             src = elem.get('src') or elem.get('href')
-            if src and src.startswith('http://'):
+            if src and src.startswith('http://') and src not in seen:
+                seen.add(src)
                 mixed_content.append({
                     'element': elem.name,
                     'url': src,
                     'attribute': 'src' if elem.get('src') else 'href'
                 })
-        return mixed_content[:10]  # Limit to first 10
+                if len(mixed_content) == MAX_MIXED_CONTENT:
+                    break
+        return mixed_content
 
-    def _check_mobile_friendly(self, soup):
+    def _check_mobile_friendly(self, tags, img_counts):
         """Enhanced mobile-friendly checks"""
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        metas = tags['meta']
+        viewport = _find_meta(metas, 'name', 'viewport')
         
         return {
             'has_viewport': bool(viewport),
             'viewport_content': viewport.get('content') if viewport else None,
-            'responsive_images': len(soup.find_all('img', srcset=True)),
-            'mobile_specific_meta': bool(soup.find('meta', attrs={'name': 'format-detection'})),
-            'touch_icons': len(soup.find_all('link', rel=lambda x: x and 'touch-icon' in str(x))),
-            'media_queries_in_html': len(soup.find_all('style')),
-            'responsive_meta_tags': len(soup.find_all('meta', attrs={'name': lambda x: x and 'mobile' in str(x).lower()}))
+            'responsive_images': img_counts['srcset'],
+            'mobile_specific_meta': bool(_find_meta(metas, 'name', 'format-detection')),
+            'touch_icons': len([l for l in tags['link'] if l.get('rel') and 'touch-icon' in ' '.join(l['rel'])]),
+            'media_queries_in_html': len(tags['style']),
+            'responsive_meta_tags': len([m for m in metas if m.get('name') and 'mobile' in m['name'].lower()])
         }
 
-    def _check_accessibility(self, soup):
+    def _check_accessibility(self, tags, img_counts):
         """Enhanced accessibility checks"""
+        anchors = tags['a']
         return {
-            'images_without_alt': len(soup.find_all('img', alt=False)),
-            'images_with_empty_alt': len(soup.find_all('img', alt="")),
-            'images_with_alt': len(soup.find_all('img', alt=True)),
-            'links_without_text': len([a for a in soup.find_all('a') if not a.text.strip() and not a.find('img')]),
-            'links_with_title': len(soup.find_all('a', title=True)),
-            'headings_structure': len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])),
-            'h1_count': len(soup.find_all('h1')),
-            'form_labels': len(soup.find_all('label')),
-            'form_inputs': len(soup.find_all(['input', 'textarea', 'select'])),
-            'lang_attribute': bool(soup.find('html', lang=True)),
-            'skip_links': len(soup.find_all('a', href=lambda x: x and x.startswith('#'))),
-            'aria_labels': len(soup.find_all(attrs={'aria-label': True})),
-            'role_attributes': len(soup.find_all(attrs={'role': True}))
+            'images_without_alt': img_counts['without_alt'],
+            'images_with_empty_alt': img_counts['empty_alt'],
+            'images_with_alt': img_counts['with_alt'],
+            'links_without_text': len([a for a in anchors if not a.text.strip() and not a.find('img')]),
+            'links_with_title': len([a for a in anchors if 'title' in a.attrs]),
+            'headings_structure': len(tags['h1,h2,h3,h4,h5,h6']),
+            'h1_count': len(tags['h1']),
+            'form_labels': len(tags['label']),
+            'form_inputs': len(tags['input']) + len(tags['textarea']) + len(tags['select']),
+            'lang_attribute': any('lang' in h.attrs for h in tags['html']),
+            'skip_links': len([a for a in anchors if a.get('href', '').startswith('#')]),
+            'aria_labels': len(tags['[aria-label]']),
+            'role_attributes': len(tags['[role]'])
         }
 
-    def _basic_performance_metrics(self, soup):
+    def _basic_performance_metrics(self, tags, img_counts):
         """Enhanced performance metrics"""
+        # Count scripts and linked anchors in one pass over each bucket
+        external_scripts = inline_scripts = 0
+        for script in tags['script']:
+            src = script.get('src')
+            if not src:
+                inline_scripts += 1
+            elif src.startswith(_EXTERNAL_URL_PREFIXES):
+                external_scripts += 1
+        total_links = external_links = 0
+        for a in tags['a']:
+            href = a.get('href')
+            if href is not None:
+                total_links += 1
+                if href.startswith(_EXTERNAL_URL_PREFIXES):
+                    external_links += 1
+        
         return {
-            'images_total': len(soup.find_all('img')),
-            'images_without_alt': len(soup.find_all('img', alt=False)),
-            'images_with_alt': len(soup.find_all('img', alt=True)),
-            'images_lazy_loading': len(soup.find_all('img', loading='lazy')),
-            'images_with_srcset': len(soup.find_all('img', srcset=True)),
-            'external_scripts': len([s for s in soup.find_all('script', src=True) 
-                                   if s.get('src', '').startswith(('http', '//'))]),
-            'inline_scripts': len([s for s in soup.find_all('script') if not s.get('src')]),
-            'external_stylesheets': len([l for l in soup.find_all('link', rel='stylesheet') 
-                                       if l.get('href', '').startswith(('http', '//'))]),
-            'inline_styles': len(soup.find_all('style')),
-            'total_links': len(soup.find_all('a', href=True)),
-            'external_links': len([a for a in soup.find_all('a', href=True) 
-                                 if a.get('href', '').startswith(('http', '//'))]),
-            'forms': len(soup.find_all('form')),
-            'iframes': len(soup.find_all('iframe')),
-            'videos': len(soup.find_all('video')),
-            'audios': len(soup.find_all('audio')),
-            'canvas_elements': len(soup.find_all('canvas')),
-            'svg_elements': len(soup.find_all('svg'))
+            'images_total': img_counts['total'],
+            'images_without_alt': img_counts['without_alt'],
+            'images_with_alt': img_counts['with_alt'],
+            'images_lazy_loading': img_counts['lazy'],
+            'images_with_srcset': img_counts['srcset'],
+            'external_scripts': external_scripts,
+            'inline_scripts': inline_scripts,
+            'external_stylesheets': len([l for l in tags['link'] 
+                                       if _rel_matches(l, ('stylesheet',)) and l.get('href', '').startswith(_EXTERNAL_URL_PREFIXES)]),
+            'inline_styles': len(tags['style']),
+            'total_links': total_links,
+            'external_links': external_links,
+            'forms': len(tags['form']),
+            'iframes': len(tags['iframe']),
+            'videos': len(tags['video']),
+            'audios': len(tags['audio']),
+            'canvas_elements': len(tags['canvas']),
+            'svg_elements': len(tags['svg'])
         }
 
-    def _extract_seo_data(self, soup):
+    def _extract_seo_data(self, tags, img_counts, full_text, html_size):
         """Extract comprehensive SEO data"""
-        title = soup.find('title')
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        robots_meta = soup.find('meta', attrs={'name': 'robots'})
+        metas = tags['meta']
+        title = tags['title'][0] if tags['title'] else None
+        meta_desc = _find_meta(metas, 'name', 'description')
+        meta_keywords = _find_meta(metas, 'name', 'keywords')
+        robots_meta = _find_meta(metas, 'name', 'robots')
         
         seo_data = {
             'title_length': len(title.text) if title else 0,
@@ -1069,21 +1482,21 @@ class WebScraper:
             'meta_description_words': len(meta_desc.get('content', '').split()) if meta_desc else 0,
             'meta_keywords': meta_keywords.get('content', '') if meta_keywords else '',
             'robots_meta': robots_meta.get('content', '') if robots_meta else '',
-            'h1_count': len(soup.find_all('h1')),
-            'h1_text': [h1.text.strip() for h1 in soup.find_all('h1')],
-            'h2_count': len(soup.find_all('h2')),
-            'h3_count': len(soup.find_all('h3')),
-            'total_headings': len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])),
-            'images_without_alt': len(soup.find_all('img', alt=False)),
-            'images_total': len(soup.find_all('img')),
+            'h1_count': len(tags['h1']),
+            'h1_text': [h1.text.strip() for h1 in tags['h1']],
+            'h2_count': len(tags['h2']),
+            'h3_count': len(tags['h3']),
+            'total_headings': len(tags['h1,h2,h3,h4,h5,h6']),
+            'images_without_alt': img_counts['without_alt'],
+            'images_total': img_counts['total'],
             'internal_links_count': 0,  # Will be updated after link extraction
             'external_links_count': 0,  # Will be updated after link extraction
-            'canonical_url': soup.find('link', rel='canonical'),
-            'schema_markup': len(soup.find_all(attrs={'itemscope': True})) > 0,
-            'opengraph_present': bool(soup.find('meta', property=lambda x: x and x.startswith('og:'))),
-            'twitter_cards_present': bool(soup.find('meta', attrs={'name': lambda x: x and x.startswith('twitter:')})),
-            'structured_data_present': bool(soup.find('script', type='application/ld+json')),
-            'word_count_estimate': len(soup.get_text().split()),
+            'canonical_url': next((l for l in tags['link'] if _rel_matches(l, ('canonical',))), None),
+            'schema_markup': bool(tags['[itemscope]']),
+            'opengraph_present': any(m.get('property', '').startswith('og:') for m in metas),
+            'twitter_cards_present': any(m.get('name', '').startswith('twitter:') for m in metas),
+            'structured_data_present': any(s.get('type') == 'application/ld+json' for s in tags['script']),
+            'word_count_estimate': _count_words(full_text),
             'text_to_html_ratio': 0  # Will be calculated
         }
         
@@ -1091,13 +1504,12 @@ class WebScraper:
             seo_data['canonical_url'] = seo_data['canonical_url'].get('href', '')
         
         # Calculate text to HTML ratio
-        text_length = len(soup.get_text())
-        html_length = len(str(soup))
-        seo_data['text_to_html_ratio'] = round(text_length / html_length, 3) if html_length > 0 else 0
+        text_length = len(full_text)
+        seo_data['text_to_html_ratio'] = round(text_length / html_size, 3) if html_size > 0 else 0
         
         return seo_data
 
-    def _extract_links(self, soup, base_url):
+    def _extract_links(self, tags, base_url, parsed_base):
         """Extract all links with enhanced categorization"""
         links = {
             'internal': [],
@@ -1111,43 +1523,50 @@ class WebScraper:
             'footer': []
         }
         
-        base_domain = urlparse(base_url).netloc
-        social_domains = ['facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com', 
-                         'youtube.com', 'tiktok.com', 'pinterest.com', 'snapchat.com',
-                         'whatsapp.com', 'telegram.org']
-        download_extensions = ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', 
-                              '.zip', '.rar', '.mp3', '.mp4', '.avi', '.mov', '.jpg', '.png']
+        base_domain = parsed_base.netloc
+        base_origin = f'{parsed_base.scheme}://{base_domain}' if parsed_base.scheme in ('http', 'https') and base_domain else None
+        # Menus and footers repeat the same hrefs; resolve each distinct one once
+        resolved = {}
         
-        for link in soup.find_all('a', href=True):
+        for link in tags['a']:
             href = link.get('href')
+            if href is None:
+                continue
             
             # Handle special links
-            if href.startswith('mailto:'):
+            if href.startswith(_MAILTO_PREFIX):
                 links['email'].append({
-                    'email': href[7:],
+                    'email': href[len(_MAILTO_PREFIX):],
                     'text': link.text.strip()
                 })
                 continue
-            elif href.startswith('tel:'):
-                phone_clean = href[4:].replace('-', '').replace(' ', '').replace('(', '').replace(')', '')
+            elif href.startswith(_TEL_PREFIX):
+                phone_clean = href[len(_TEL_PREFIX):].replace('-', '').replace(' ', '').replace('(', '').replace(')', '')
                 links['phone'].append({
                     'phone': phone_clean,
-                    'original': href[4:],
+                    'original': href[len(_TEL_PREFIX):],
                     'text': link.text.strip()
                 })
                 continue
             
-            absolute_url = urljoin(base_url, href)
-            link_domain = urlparse(absolute_url).netloc
+            if href not in resolved:
+                absolute_url, link_domain = _resolve_link(href, base_url, base_origin, base_domain)
+                lower_url = absolute_url.lower()
+                platform = next((name for domain, name in _SOCIAL_DOMAINS if domain in link_domain), None)
+                file_type = next((ext for ext in _DOWNLOAD_EXTENSIONS if ext in lower_url), None)
+                resolved[href] = (absolute_url, link_domain, platform, file_type)
+            absolute_url, link_domain, platform, file_type = resolved[href]
+            rel = link.get('rel', [])
+            classes = link.get('class', [])
             
             link_data = {
                 'url': absolute_url,
                 'text': link.text.strip(),
                 'title': link.get('title', ''),
-                'rel': link.get('rel', []),
+                'rel': rel,
                 'target': link.get('target', ''),
-                'nofollow': 'nofollow' in link.get('rel', []),
-                'class': link.get('class', []),
+                'nofollow': 'nofollow' in rel,
+                'class': classes,
                 'parent_element': link.parent.name if link.parent else None
             }
             
@@ -1160,32 +1579,28 @@ class WebScraper:
                 links['external'].append(link_data)
                 
                 # Check for social media
-                if any(social in link_domain for social in social_domains):
-                    social_link = link_data.copy()
-                    social_link['platform'] = next(social.replace('.com', '') for social in social_domains if social in link_domain)
-                    links['social'].append(social_link)
+                if platform:
+                    links['social'].append({**link_data, 'platform': platform})
             
             # Check for downloads
-            if any(ext in absolute_url.lower() for ext in download_extensions):
-                download_link = link_data.copy()
-                download_link['file_type'] = next(ext for ext in download_extensions if ext in absolute_url.lower())
-                links['download'].append(download_link)
+            if file_type:
+                links['download'].append({**link_data, 'file_type': file_type})
             
-            # Check for navigation links
-            if link.find_parent(['nav', 'header']) or 'nav' in link.get('class', []):
+            # Check for navigation links (class first; find_parent walks the ancestors)
+            if 'nav' in classes or link.find_parent(['nav', 'header']):
                 links['navigation'].append(link_data)
             
             # Check for footer links
-            if link.find_parent('footer') or 'footer' in link.get('class', []):
+            if 'footer' in classes or link.find_parent('footer'):
                 links['footer'].append(link_data)
         
         return links
 
-    def _extract_images(self, soup, base_url):
+    def _extract_images(self, tags, base_url):
         """Extract all images with enhanced metadata"""
         images = []
         
-        for img in soup.find_all('img'):
+        for img in tags['img']:
             src = img.get('src')
             if src:
                 absolute_url = urljoin(base_url, src)
@@ -1231,11 +1646,11 @@ class WebScraper:
         
         return images
 
-    def _extract_forms(self, soup):
+    def _extract_forms(self, tags):
         """Extract comprehensive form data"""
         forms = []
         
-        for form in soup.find_all('form'):
+        for form in tags['form']:
             form_data = {
                 'action': form.get('action', ''),
                 'method': form.get('method', 'get').lower(),
@@ -1320,12 +1735,10 @@ class WebScraper:
         return forms
 
     def _get_robots_txt(self, url):
-        """Get robots.txt content with timeout and error handling"""
+        """Get robots.txt content with timeout and error handling (unreachable hosts raise)"""
         try:
             robots_url = urljoin(url, '/robots.txt')
-            response = requests.get(robots_url, timeout=15, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; WebScraper/1.0)'
-            })
+            response = self.session.get(robots_url, timeout=FETCH_TIMEOUT)
             if response.status_code == 200:
                 return {
                     'url': robots_url,
@@ -1335,87 +1748,161 @@ class WebScraper:
                     'last_modified': response.headers.get('last-modified', ''),
                     'content_type': response.headers.get('content-type', '')
                 }
+        except _UNREACHABLE_ERRORS:
+            raise
         except Exception as e:
             logger.debug(f"Could not fetch robots.txt from {url}: {e}")
         return None
 
+    def _open_sitemap(self, sitemap_url):
+        """Request a sitemap location, returning the unread response if it exists"""
+        # Most locations don't exist; a HEAD answers that without a body, so the
+        # connection stays reusable. Servers that refuse HEAD still get the GET
+        head = self.session.head(sitemap_url, timeout=FETCH_TIMEOUT, allow_redirects=True)
+        if head.status_code not in SITEMAP_HEAD_UNSUPPORTED and head.status_code != 200:
+            return None
+        
+        # Stream the body so XML sitemaps can be parsed incrementally
+        response = self.session.get(sitemap_url, timeout=FETCH_TIMEOUT, stream=True)
+        if response.status_code != 200:
+            response.close()
+            return None
+        return response
+
     def _get_sitemap_data(self, url):
-        """Get sitemap data with enhanced parsing"""
+        """Get sitemap data with enhanced parsing (raises if no location could be reached)"""
         sitemaps = []
-        
-        # Try common sitemap locations
-        sitemap_urls = [
-            urljoin(url, '/sitemap.xml'),
-            urljoin(url, '/sitemap_index.xml'),
-            urljoin(url, '/sitemap.txt'),
-            urljoin(url, '/sitemaps.xml'),
-            urljoin(url, '/wp-sitemap.xml'),
-            urljoin(url, '/sitemap_index.php')
-        ]
-        
-        for sitemap_url in sitemap_urls:
+        unreachable = None
+        unreachable_count = 0
+        
+        # Probe every location concurrently but keep the first hit in preference order
+        probes = [(sitemap_url, _PROBE_POOL.submit(self._open_sitemap, sitemap_url))
+                  for sitemap_url in (urljoin(url, path) for path in SITEMAP_PATHS)]
+        
+        for sitemap_url, probe in probes:
+            if sitemaps:
+                # Found one already; release the connections the others opened
+                probe.cancel()
+                probe.add_done_callback(_close_probe)
+                continue
             try:
-                response = requests.get(sitemap_url, timeout=20, headers={
-                    'User-Agent': 'Mozilla/5.0 (compatible; WebScraper/1.0)'
-                })
-                if response.status_code == 200:
+                response = probe.result()
+                if response is None:
+                    continue
+                with response:
                     sitemap_data = {
                         'url': sitemap_url,
                         'status': response.status_code,
                         'content_type': response.headers.get('content-type', ''),
-                        'size': len(response.content),
+                        # size: decoded bytes read (up to the cut-off for truncated sitemaps);
+                        # content_length: the declared size on the wire, 0 when not sent
+                        'size': 0,
+                        'content_length': int(response.headers.get('content-length') or 0),
                         'last_modified': response.headers.get('last-modified', ''),
                         'is_compressed': 'gzip' in response.headers.get('content-encoding', '')
                     }
                     
-                    # Parse XML sitemaps
-                    if 'xml' in sitemap_url.lower() and len(response.content) < 2000000:  # Limit size to 2MB
+                    # Parse XML sitemaps; the streaming parser stops reading at MAX_SITEMAP_URLS
+                    if 'xml' in sitemap_url.lower():
                         try:
-                            root = ET.fromstring(response.content)
-                            urls = []
-                            
-                            # Handle sitemap index
-                            for sitemap_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}sitemap'):
-                                loc = sitemap_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                                lastmod = sitemap_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-                                if loc is not None:
-                                    url_data = {'type': 'sitemap', 'url': loc.text}
-                                    if lastmod is not None:
-                                        url_data['lastmod'] = lastmod.text
-                                    urls.append(url_data)
-                            
-                            # Handle regular sitemap
-                            for url_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'):
-                                loc = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                                lastmod = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-                                changefreq = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}changefreq')
-                                priority = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}priority')
-                                
-                                if loc is not None:
-                                    url_data = {'type': 'url', 'url': loc.text}
-                                    if lastmod is not None:
-                                        url_data['lastmod'] = lastmod.text
-                                    if changefreq is not None:
-                                        url_data['changefreq'] = changefreq.text
-                                    if priority is not None:
-                                        url_data['priority'] = priority.text
-                                    urls.append(url_data)
-                            
-                            sitemap_data['urls'] = urls[:500]  # Limit to first 500
-                            sitemap_data['url_count'] = len(urls)
-                            sitemap_data['has_images'] = bool(root.findall('.//{http://www.google.com/schemas/sitemap-image/1.1}image'))
-                            sitemap_data['has_videos'] = bool(root.findall('.//{http://www.google.com/schemas/sitemap-video/1.1}video'))
-                        except ET.ParseError as e:
+                            self._parse_sitemap_xml(response, sitemap_data)
+                        except (ET.ParseError, zlib.error) as e:
                             logger.debug(f"Could not parse XML sitemap {sitemap_url}: {e}")
+                    else:
+                        sitemap_data['size'] = len(response.content)
                     
                     sitemaps.append(sitemap_data)
-                    break  # Found one, don't need to check others
             except Exception as e:
+                if isinstance(e, _UNREACHABLE_ERRORS):
+                    unreachable = e
+                    unreachable_count += 1
                 logger.debug(f"Could not fetch sitemap {sitemap_url}: {e}")
                 continue
         
+        if unreachable_count == len(probes):
+            raise unreachable
         return sitemaps
 
+    def _parse_sitemap_xml(self, response, sitemap_data):
+        """Stream-parse an XML sitemap, stopping once MAX_SITEMAP_URLS entries are collected"""
+        parser = ET.XMLPullParser(events=('end',), **SITEMAP_PARSER_OPTIONS)
+        urls = []
+        has_images = False
+        has_videos = False
+        bytes_read = 0
+        truncated = False
+        decompressor = None
+        sniffed = False
+        
+        for chunk in response.iter_content(chunk_size=65536):
+            if not sniffed and chunk:
+                sniffed = True
+                # Gzipped file body: inflate while streaming instead of buffering it
+                if chunk.startswith(GZIP_MAGIC):
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    sitemap_data['is_compressed'] = True
+            if decompressor:
+                chunk = decompressor.decompress(chunk)
+            bytes_read += len(chunk)
+            sitemap_data['size'] = bytes_read
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                tag = elem.tag.rpartition('}')[2]
+                if tag == SITEMAP_URL_TAG or tag == SITEMAP_INDEX_TAG:
+                    # Read the entry's children in one pass; the first of each tag wins, like find()
+                    texts = {}
+                    for child in elem:
+                        # Skip comments and processing instructions (non-string tags in lxml)
+                        if isinstance(child.tag, str):
+                            texts.setdefault(child.tag.rpartition('}')[2], child.text)
+                    if SITEMAP_LOC_TAG in texts:
+                        url_data = {'type': 'url' if tag == SITEMAP_URL_TAG else 'sitemap', 'url': texts[SITEMAP_LOC_TAG]}
+                        for field in SITEMAP_FIELD_TAGS[tag]:
+                            if field in texts:
+                                url_data[field] = texts[field]
+                        urls.append(url_data)
+                        if len(urls) >= MAX_SITEMAP_URLS:
+                            truncated = True
+                            break
+                    # Entries are fully read once their end tag is seen
+                    elem.clear()
+                    if _SITEMAP_LXML:
+                        # Also unlink the cleared entries so the root does not keep them
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                elif tag == SITEMAP_IMAGE_TAG:
+                    has_images = True
+                elif tag == SITEMAP_VIDEO_TAG:
+                    has_videos = True
+            if truncated:
+                break
+        
+        if not truncated:
+            parser.close()
+        
+        sitemap_data['urls'] = urls
+        sitemap_data['url_count'] = len(urls)
+        sitemap_data['urls_truncated'] = truncated
+        sitemap_data['has_images'] = has_images
+        sitemap_data['has_videos'] = has_videos
+
+def _scrape_urls(urls, minify_level, wait_ms=0):
+    """Scrape URLs sequentially with the calling thread's browser (runs on _SCRAPE_POOL)"""
+    results = []
+    
+    with WebScraper() as scraper:
+        for url in urls:
+            logger.info(f"Scraping URL: {url}")
+            result = scraper.scrape_website(url, wait_ms)
+            
+            # Apply minification if requested
+            if minify_level and minify_level != 'none':
+                result = scraper.minify_data(result, minify_level)
+                
+            results.append(result)
+    
+    return results
+
 # Flask endpoints remain the same but with better error handling
 @app.route('/scrape', methods=['POST'])
 def scrape_endpoint():
@@ -1424,31 +1911,29 @@ def scrape_endpoint():
         data = request.get_json()
         
         if not data or 'url' not in data:
-            return jsonify({'error': 'URL is required'}), 400
+            return _json_response({'error': 'URL is required'}), 400
         
         url = data['url']
         minify_level = data.get('minify', 'standard')  # 'light', 'standard', 'aggressive', 'none'
+        try:
+            wait_ms = _parse_wait_ms(data.get('wait_ms', 0))
+        except ValueError as e:
+            return _json_response({'error': str(e)}), 400
         
         # Validate URL
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
+        url = _normalize_url(url)
         
         logger.info(f"Scraping URL: {url} with minify level: {minify_level}")
         
-        # Scrape the website
-        with WebScraper() as scraper:
-            result = scraper.scrape_website(url)
-            
-            # Apply minification if requested
-            if minify_level and minify_level != 'none':
-                result = scraper.minify_data(result, minify_level)
+        # Scrape the website on a pool thread that already holds a browser
+        result = _SCRAPE_POOL.submit(_scrape_urls, [url], minify_level, wait_ms).result()[0]
         
         logger.info(f"Scraping completed for: {url}")
-        return jsonify(result)
+        return _json_response(result)
         
     except Exception as e:
         logger.error(f"Endpoint error: {str(e)}")
-        return jsonify({'error': str(e), 'timestamp': datetime.now().isoformat()}), 500
+        return _json_response({'error': str(e), 'timestamp': _timestamp()}), 500
 
 @app.route('/scrape/batch', methods=['POST'])
 def scrape_batch_endpoint():
@@ -1457,90 +1942,108 @@ def scrape_batch_endpoint():
         data = request.get_json()
         
         if not data or 'urls' not in data:
-            return jsonify({'error': 'URLs list is required'}), 400
+            return _json_response({'error': 'URLs list is required'}), 400
         
         urls = data['urls']
         minify_level = data.get('minify', 'standard')
+        try:
+            wait_ms = _parse_wait_ms(data.get('wait_ms', 0))
+        except ValueError as e:
+            return _json_response({'error': str(e)}), 400
         
         if not isinstance(urls, list) or len(urls) == 0:
-            return jsonify({'error': 'URLs must be a non-empty list'}), 400
-        
-        if len(urls) > 10:  # Limit batch size
-            return jsonify({'error': 'Maximum 10 URLs per batch'}), 400
-        
-        results = []
-        
-        with WebScraper() as scraper:
-            for url in urls:
-                if not url.startswith(('http://', 'https://')):
-                    url = 'https://' + url
-                
-                logger.info(f"Scraping URL: {url}")
-                result = scraper.scrape_website(url)
-                
-                # Apply minification if requested
-                if minify_level and minify_level != 'none':
-                    result = scraper.minify_data(result, minify_level)
-                    
-                results.append(result)
-        
-        return jsonify({'results': results, 'count': len(results), 'minify_level': minify_level})
+            return _json_response({'error': 'URLs must be a non-empty list'}), 400
+        
+        if len(urls) > MAX_BATCH_URLS:
+            return _json_response({'error': f'Maximum {MAX_BATCH_URLS} URLs per batch'}), 400
+        
+        urls = [_normalize_url(url) for url in urls]
+        
+        # Scrape each URL as its own pool task and stream the results back in request
+        # order, so the first ones ship while later pages are still rendering. At most
+        # BATCH_WINDOW of this batch's URLs are on the pool at once; the next is submitted
+        # as each one finishes, so /scrape requests arriving meanwhile are not queued
+        # behind the whole batch
+        def submit(url):
+            return _SCRAPE_POOL.submit(_scrape_urls, [url], minify_level, wait_ms)
+        
+        futures = deque(submit(url) for url in urls[:BATCH_WINDOW])
+        
+        def generate():
+            yield b'{"results":['
+            for i, url in enumerate(urls):
+                future = futures.popleft()
+                try:
+                    result = future.result()[0]
+                except Exception as e:
+                    logger.error(f"Batch scrape failed for {url}: {str(e)}")
+                    result = {'error': str(e), 'url': url, 'timestamp': _timestamp()}
+                if i + BATCH_WINDOW < len(urls):
+                    futures.append(submit(urls[i + BATCH_WINDOW]))
+                yield (b',' if i else b'') + orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+            # Close the array and append the remaining keys of the envelope (minus its '{')
+            yield b'],' + orjson.dumps({'count': len(urls), 'minify_level': minify_level})[1:]
+        
+        return Response(generate(), mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Batch endpoint error: {str(e)}")
-        return jsonify({'error': str(e), 'timestamp': datetime.now().isoformat()}), 500
+        return _json_response({'error': str(e), 'timestamp': _timestamp()}), 500
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return _json_response({
         'status': 'healthy', 
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _timestamp(),
         'version': '2.2'
     })
 
+# The usage info never changes, so it is encoded once at import
+_HOME_BODY = orjson.dumps({
+    'message': 'Enhanced Web Scraper API',
+    'version': '2.2',
+    'usage': {
+        'single': 'POST to /scrape with {"url": "https://example.com", "minify": "standard"}',
+        'batch': 'POST to /scrape/batch with {"urls": ["https://example1.com"], "minify": "aggressive"}'
+    },
+    'minify_levels': {
+        'none': 'No minification (full data)',
+        'light': 'Basic text cleaning only',
+        'standard': 'Remove empty values and compress content (recommended)',
+        'aggressive': 'Maximum compression, remove optional sections'
+    },
+    'endpoints': {
+        'POST /scrape': 'Scrape a single website',
+        'POST /scrape/batch': f'Scrape multiple websites (max {MAX_BATCH_URLS})',
+        'GET /health': 'Health check',
+        'GET /': 'This info'
+    },
+    'features': [
+        'Comprehensive content extraction with semantic analysis',
+        'Enhanced meta tags & structured data parsing',
+        'Business information extraction (addresses, phones, emails)',
+        'Contact information detection',
+        'Page structure analysis',
+        'Comprehensive SEO analysis',
+        'Advanced technical performance metrics',
+        'Enhanced security and accessibility checks',
+        'Detailed links analysis with categorization',
+        'Advanced image analysis with quality assessment',
+        'Comprehensive form extraction and analysis',
+        'Enhanced robots.txt and sitemap analysis',
+        'NO screenshots (removed for efficiency)',
+        'Advanced data minification for API efficiency',
+        'Enhanced mobile-friendly and accessibility checks',
+        'Business hours and service extraction',
+        'Social media profile detection'
+    ]
+})
+
 @app.route('/', methods=['GET'])
 def home():
     """Enhanced home endpoint with usage info"""
-    return jsonify({
-        'message': 'Enhanced Web Scraper API',
-        'version': '2.2',
-        'usage': {
-            'single': 'POST to /scrape with {"url": "https://example.com", "minify": "standard"}',
-            'batch': 'POST to /scrape/batch with {"urls": ["https://example1.com"], "minify": "aggressive"}'
-        },
-        'minify_levels': {
-            'none': 'No minification (full data)',
-            'light': 'Basic text cleaning only',
-            'standard': 'Remove empty values and compress content (recommended)',
-            'aggressive': 'Maximum compression, remove optional sections'
-        },
-        'endpoints': {
-            'POST /scrape': 'Scrape a single website',
-            'POST /scrape/batch': 'Scrape multiple websites (max 10)',
-            'GET /health': 'Health check',
-            'GET /': 'This info'
-        },
-        'features': [
-            'Comprehensive content extraction with semantic analysis',
-            'Enhanced meta tags & structured data parsing',
-            'Business information extraction (addresses, phones, emails)',
-            'Contact information detection',
-            'Page structure analysis',
-            'Comprehensive SEO analysis',
-            'Advanced technical performance metrics',
-            'Enhanced security and accessibility checks',
-            'Detailed links analysis with categorization',
-            'Advanced image analysis with quality assessment',
-            'Comprehensive form extraction and analysis',
-            'Enhanced robots.txt and sitemap analysis',
-            'NO screenshots (removed for efficiency)',
-            'Advanced data minification for API efficiency',
-            'Enhanced mobile-friendly and accessibility checks',
-            'Business hours and service extraction',
-            'Social media profile detection'
-        ]
-    })
+    return Response(_HOME_BODY, mimetype='application/json')
 
 if __name__ == '__main__':
     logger.info("Starting Enhanced Web Scraper API v2.2...")